@@ -0,0 +1,25 @@
+"""
+Build the ahead-of-time compiled Alien Numeral conversion kernel.
+
+Compiles main._to_integer_kernel with numba.pycc into the _alien_native
+extension module next to this script. When that module is importable,
+main.py uses it directly and never imports Numba, so there is no JIT
+compile or Numba import cost at startup.
+
+Usage:
+    python build_native.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from main import _to_integer_kernel
+
+cc = CC('_alien_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('to_integer_kernel', 'i8(Array(u1, 1, "C", readonly=True), i8[:])')(_to_integer_kernel)
+
+
+if __name__ == "__main__":
+    cc.compile()
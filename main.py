@@ -5,7 +5,110 @@ This module provides functionality to convert Alien Numeral strings into
 their integer equivalents.
 """
 
-from typing import Dict, Tuple, Optional
+import sys
+from functools import cache, lru_cache
+from itertools import chain, product
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Tuple, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional accelerator for long numerals
+    np = None
+
+
+def _ascii_table(mapping: Mapping[str, int], default: int = 0) -> Tuple[int, ...]:
+    """
+    Build a 128-entry lookup table indexed by ASCII code.
+    
+    Args:
+        mapping (Mapping[str, int]): Single-character keys mapped to values.
+        default (int): Value stored for characters missing from the mapping.
+    
+    Returns:
+        Tuple[int, ...]: A table where ``table[ord(char)] == mapping[char]``.
+    """
+    return tuple(mapping.get(chr(code), default) for code in range(128))
+
+
+def _pair_table(symbol_values: Mapping[str, int],
+                subtraction_pairs: Mapping[str, Iterable[str]]) -> bytes:
+    """
+    Build a flat 128x128 table of legal adjacent symbol pairs.
+    
+    Args:
+        symbol_values (Mapping[str, int]): Mapping of symbols to their values.
+        subtraction_pairs (Mapping[str, Iterable[str]]): Symbols each symbol
+            may precede in subtraction notation.
+    
+    Returns:
+        bytes: A table where ``table[(ord(a) << 7) | ord(b)]`` is 1 if ``b``
+            may follow ``a`` (an addition, or a valid subtraction pair).
+    """
+    table = bytearray(128 * 128)
+    for current, current_value in symbol_values.items():
+        for next_char, next_value in symbol_values.items():
+            if current_value >= next_value or next_char in subtraction_pairs.get(current, ()):
+                table[(ord(current) << 7) | ord(next_char)] = 1
+    return bytes(table)
+
+
+def _delta_table(symbol_values: Mapping[str, int]) -> Tuple[int, ...]:
+    """
+    Build a flat 128x128 table of signed contributions for adjacent pairs.
+    
+    Treats conversion as a state machine whose state is the previous symbol:
+    reading the next symbol emits the previous symbol's value, negated if it
+    is smaller than the next one.
+    
+    Args:
+        symbol_values (Mapping[str, int]): Mapping of symbols to their values.
+    
+    Returns:
+        Tuple[int, ...]: A table where ``table[(ord(a) << 7) | ord(b)]`` is
+            the contribution of ``a`` when it is followed by ``b``.
+    """
+    table = [0] * (128 * 128)
+    for current, current_value in symbol_values.items():
+        for next_char, next_value in symbol_values.items():
+            delta = -current_value if current_value < next_value else current_value
+            table[(ord(current) << 7) | ord(next_char)] = delta
+    return tuple(table)
+
+
+def _to_integer_kernel(buf, lut):
+    """
+    Sum the signed values of an encoded numeral.
+    
+    Written against a ``uint8`` array and an integer lookup table only, so
+    Numba can compile it to a native loop, either ahead of time with
+    build_native.py or just in time when it is installed.
+    
+    Args:
+        buf: The numeral as an array of ASCII codes. Must not be empty.
+        lut: Symbol values indexed by ASCII code.
+    
+    Returns:
+        int: The integer value of the numeral.
+    """
+    n = buf.shape[0]
+    total = 0
+    for i in range(n - 1):
+        value = lut[buf[i]]
+        total += -value if value < lut[buf[i + 1]] else value
+    return total + lut[buf[n - 1]]
+
+
+try:
+    # Ahead-of-time build of _to_integer_kernel (see build_native.py), which
+    # avoids importing Numba and JIT-compiling at startup
+    from _alien_native import to_integer_kernel as _compiled_kernel
+except ImportError:
+    try:
+        from numba import njit
+    except ImportError:  # Numba is an optional JIT for the conversion kernel
+        _compiled_kernel = None
+    else:
+        _compiled_kernel = njit(cache=True, boundscheck=False)(_to_integer_kernel)
 
 
 class AlienNumeralConverter:
@@ -21,11 +124,14 @@ class AlienNumeralConverter:
         SUBTRACTION_CASES (Dict[str, int]): Mapping of two-character combinations
             that represent subtraction cases.
     
+    The converter holds no state: every method is a static method or class
+    method, so there is no need to create an instance (although doing so
+    still works).
+    
     Example:
-        >>> converter = AlienNumeralConverter()
-        >>> converter.to_integer("AAA")
+        >>> AlienNumeralConverter.to_integer("AAA")
         3
-        >>> converter.to_integer("LBAAA")
+        >>> AlienNumeralConverter.to_integer("LBAAA")
         58
     """
     
@@ -52,211 +158,419 @@ class AlienNumeralConverter:
     }
     
     # Valid subtraction pairs (smaller value can appear before larger value)
-    VALID_SUBTRACTION_PAIRS: Dict[str, list] = {
-        'A': ['B', 'Z'],      # A can appear before B (AB=4) or Z (AZ=9)
-        'Z': ['L', 'C'],      # Z can appear before L (ZL=40) or C (ZC=90)
-        'C': ['D', 'R']       # C can appear before D (CD=400) or R (CR=900)
+    VALID_SUBTRACTION_PAIRS: Dict[str, FrozenSet[str]] = {
+        'A': frozenset('BZ'),  # A can appear before B (AB=4) or Z (AZ=9)
+        'Z': frozenset('LC'),  # Z can appear before L (ZL=40) or C (ZC=90)
+        'C': frozenset('DR')   # C can appear before D (CD=400) or R (CR=900)
     }
     
-    def __init__(self) -> None:
+    @staticmethod
+    def to_integer(s: str) -> int:
         """
-        Initialize the AlienNumeralConverter.
+        Convert an Alien Numeral string to its integer equivalent.
         
-        The converter uses predefined mappings for symbol values and
-        subtraction cases to perform conversions.
+        Delegates to the module-level to_integer; see it for details.
         """
-        pass  # All data is stored at class level
+        return to_integer(s)
     
-    def to_integer(self, s: str) -> int:
+    @staticmethod
+    def to_integers(numerals: Iterable[str]) -> List[int]:
         """
-        Convert an Alien Numeral string to its integer equivalent.
+        Convert many Alien Numeral strings to integers in one batch.
         
-        Uses the step-by-step left-to-right method with peek-ahead logic:
-        1. Create a "bucket" (total) initialized to 0
-        2. Loop through the string from index 0 to second-to-last character
-        3. For each character, peek at the next character and compare values:
-           - If current_value < next_value: Subtract (subtraction case)
-           - If current_value >= next_value: Add (addition case)
-        4. After the loop, add the last character (always an addition case)
-        
-        Args:
-            s (str): The Alien Numeral string to convert. Must contain only
-                valid symbols: A, B, Z, L, C, D, R.
-        
-        Returns:
-            int: The integer value of the Alien Numeral string.
-        
-        Raises:
-            KeyError: If an invalid symbol is encountered in the string.
-        
-        Example:
-            >>> converter = AlienNumeralConverter()
-            >>> converter.to_integer("RCRZCAB")
-            1994
-            >>> converter.to_integer("AAA")
-            3
+        Delegates to the module-level to_integers; see it for details.
         """
-        
-        total: int = 0
-        for i in range(len(s) - 1):
-            current_value: int = self.SYMBOL_VALUES[s[i]]
-            next_value: int = self.SYMBOL_VALUES[s[i + 1]]
-            
-            if current_value < next_value:
-                total -= current_value
-            else:
-                total += current_value
-                
-        total += self.SYMBOL_VALUES[s[-1]]
-        return total
+        return to_integers(numerals)
     
-    def is_valid(self, s: str) -> bool:
+    @staticmethod
+    def is_valid(s: str) -> bool:
         """
         Check if a string contains only valid Alien Numeral symbols.
         
-        Args:
-            s (str): The string to validate.
-        
-        Returns:
-            bool: True if all characters are valid symbols, False otherwise.
-        
-        Example:
-            >>> converter = AlienNumeralConverter()
-            >>> converter.is_valid("ABC")
-            True
-            >>> converter.is_valid("XYZ")
-            False
+        Delegates to the module-level is_valid; see it for details.
         """
-        return all(char in self.SYMBOL_VALUES for char in s)
+        return is_valid(s)
     
-    def is_valid_numeral(self, s: str) -> Tuple[bool, str]:
+    @staticmethod
+    def is_valid_numeral(s: str) -> Tuple[bool, str]:
         """
         Check if a string follows proper Alien Numeral formation rules.
         
-        Rules (similar to Roman numerals):
-        1. Only valid symbols allowed
-        2. Symbols cannot repeat more than their maximum allowed times
-           - A, Z, C, R can repeat up to 3 times (e.g., AAA = 3, but AAAA is invalid, use AB)
-           - B, L, D can appear only once (no BB, LL, DD)
-        3. Subtraction only works for specific pairs:
-           - A can only precede B or Z
-           - Z can only precede L or C
-           - C can only precede D or R
-        4. A smaller value can only appear before one larger value
-        
-        Args:
-            s (str): The Alien Numeral string to validate.
-        
-        Returns:
-            Tuple[bool, str]: (is_valid, error_message)
-                - (True, "") if valid
-                - (False, error_message) if invalid
-        
-        Example:
-            >>> converter = AlienNumeralConverter()
-            >>> converter.is_valid_numeral("AAA")
-            (True, '')
-            >>> converter.is_valid_numeral("AAAA")
-            (False, "Symbol 'A' repeats more than 3 times consecutively")
-            >>> converter.is_valid_numeral("AB")
-            (True, '')
+        Delegates to the module-level is_valid_numeral; see it for details.
         """
-        # Check if string is empty
-        if not s:
-            return (False, "Empty string is not a valid numeral")
-        
-        # Check if all characters are valid symbols
-        if not self.is_valid(s):
-            invalid_chars = [c for c in s if c not in self.SYMBOL_VALUES]
-            return (False, f"Invalid symbols: {', '.join(invalid_chars)}")
-        
-        # Check for excessive repetitions
-        i = 0
-        while i < len(s):
-            char = s[i]
-            count = 1
-            
-            # Count consecutive repetitions
-            while i + count < len(s) and s[i + count] == char:
-                count += 1
-            
-            # Check against maximum allowed repetitions
-            max_allowed = self.MAX_REPETITIONS.get(char, 1)
-            if count > max_allowed:
-                return (False, f"Symbol '{char}' repeats more than {max_allowed} time(s) consecutively. Use subtraction notation instead (e.g., AB for 4, not AAAA)")
-            
-            i += count
-        
-        # Check for invalid subtraction patterns
-        for i in range(len(s) - 1):
-            current = s[i]
-            next_char = s[i + 1]
-            current_value = self.SYMBOL_VALUES[current]
-            next_value = self.SYMBOL_VALUES[next_char]
-            
-            # If current < next, it's a subtraction case - validate it
-            if current_value < next_value:
-                if current not in self.VALID_SUBTRACTION_PAIRS:
-                    return (False, f"Symbol '{current}' cannot be used in subtraction notation")
-                
-                if next_char not in self.VALID_SUBTRACTION_PAIRS[current]:
-                    return (False, f"Invalid subtraction pair: '{current}{next_char}'. {current} can only precede {', '.join(self.VALID_SUBTRACTION_PAIRS[current])}")
-        
-        return (True, "")
+        return is_valid_numeral(s)
     
-    def to_integer_safe(self, s: str) -> Tuple[Optional[int], str]:
+    @staticmethod
+    def to_integer_safe(s: str) -> Tuple[Optional[int], str]:
         """
         Safely convert an Alien Numeral string to integer with validation.
         
-        This method validates the numeral before conversion to ensure it follows
-        proper formation rules.
-        
-        Args:
-            s (str): The Alien Numeral string to convert.
-        
-        Returns:
-            Tuple[Optional[int], str]: (result, message)
-                - (integer_value, "") if successful
-                - (None, error_message) if validation fails
-        
-        Example:
-            >>> converter = AlienNumeralConverter()
-            >>> converter.to_integer_safe("AAA")
-            (3, '')
-            >>> converter.to_integer_safe("AAAA")
-            (None, "Symbol 'A' repeats more than 3 times consecutively...")
+        Delegates to the module-level to_integer_safe; see it for details.
         """
-        is_valid, error_msg = self.is_valid_numeral(s)
-        
-        if not is_valid:
-            return (None, error_msg)
-        
-        try:
-            result = self.to_integer(s)
-            return (result, "")
-        except KeyError as e:
-            return (None, f"Invalid symbol encountered: {e}")
+        return to_integer_safe(s)
     
-    def get_symbol_info(self) -> str:
+    @classmethod
+    @cache
+    def get_symbol_info(cls) -> str:
         """
         Get a formatted string describing all available symbols and their values.
         
+        The text is built once per class and reused on later calls.
+        
         Returns:
             str: A formatted string with symbol information.
         """
-        info = "Single Symbol Values:\n"
-        for symbol, value in sorted(self.SYMBOL_VALUES.items(), key=lambda x: x[1]):
-            info += f"  {symbol} = {value}\n"
+        symbols = sorted(cls.SYMBOL_VALUES.items(), key=lambda x: x[1])
+        lines = [f"  {symbol} = {value}\n" for symbol, value in symbols]
+        return "Single Symbol Values:\n" + "".join(lines)
+
+
+# Immutable copies of the class tables for the hot paths, so lookups are
+# plain sequence indexing on module globals rather than class attributes
+
+# Symbol values indexed by ASCII code (0 marks an invalid symbol)
+_LUT: Tuple[int, ...] = _ascii_table(AlienNumeralConverter.SYMBOL_VALUES)
+
+# Byte string of every valid symbol, used to reject invalid input in C
+_VALID_BYTES: bytes = ''.join(AlienNumeralConverter.SYMBOL_VALUES).encode('ascii')
+
+# str.translate table that deletes every valid symbol
+_DELETE_VALID: Dict[int, None] = str.maketrans('', '', ''.join(AlienNumeralConverter.SYMBOL_VALUES))
+
+# Maximum repetitions indexed by ASCII code (0 for invalid symbols)
+_MAX_REP: bytes = bytes(_ascii_table(AlienNumeralConverter.MAX_REPETITIONS))
+
+# Legal adjacent pairs indexed by (ord(current) << 7) | ord(next_char)
+_PAIR_OK: bytes = _pair_table(AlienNumeralConverter.SYMBOL_VALUES,
+                               AlienNumeralConverter.VALID_SUBTRACTION_PAIRS)
+
+# NumPy copies of _LUT and the pair delta table, and the length above
+# which the array path wins (the compiled kernel pays off much sooner)
+_NP_LUT = np.array(_LUT, dtype=np.int64) if np is not None else None
+_NP_DELTA = (np.array(_delta_table(AlienNumeralConverter.SYMBOL_VALUES), dtype=np.int64)
+             if np is not None else None)
+_NUMPY_MIN_LENGTH: int = 16 if _compiled_kernel is not None else 128
+
+# Total batch length above which to_integers switches to NumPy
+_BATCH_MIN_LENGTH: int = 1024
+
+
+def _encode_numeral(s: str) -> bytes:
+    """
+    Encode an Alien Numeral string to ASCII, rejecting invalid symbols.
+    
+    Args:
+        s (str): The Alien Numeral string to encode.
+    
+    Returns:
+        bytes: The ASCII codes of the symbols in ``s``.
+    
+    Raises:
+        KeyError: If an invalid symbol is encountered in the string.
+    """
+    try:
+        buf = s.encode('ascii')
+    except UnicodeEncodeError as e:
+        raise KeyError(e.object[e.start]) from None
+    
+    invalid = buf.translate(None, _VALID_BYTES)
+    if invalid:
+        raise KeyError(chr(invalid[0]))
+    
+    return buf
+
+
+@lru_cache(maxsize=1024)
+def _to_integer_cached(s: str) -> int:
+    """
+    Convert an Alien Numeral string to an integer, memoizing the result.
+    
+    The converter holds no instance state, so results are shared by every
+    instance. See to_integer for details.
+    
+    Args:
+        s (str): The Alien Numeral string to convert.
+    
+    Returns:
+        int: The integer value of the Alien Numeral string.
+    
+    Raises:
+        KeyError: If an invalid symbol is encountered in the string.
+    """
+    buf = _encode_numeral(s)
+    
+    if np is not None and len(buf) >= _NUMPY_MIN_LENGTH:
+        codes = np.frombuffer(buf, dtype=np.uint8)
+        if _compiled_kernel is not None:
+            return int(_compiled_kernel(codes, _NP_LUT))
+    
+        # Index the delta table with every adjacent pair at once, so each
+        # symbol's signed contribution is a single gather with no
+        # comparisons; the last symbol is always added.
+        pairs = codes[:-1].astype(np.uint16)
+        pairs <<= 7
+        pairs |= codes[1:]
+        return int(_NP_DELTA[pairs].sum() + _NP_LUT[codes[-1]])
+    
+    # Iterating bytes yields ints, so each step is a plain tuple index
+    # and the value of the "next" symbol is carried into the next step.
+    # A single iterator walks the buffer, avoiding a buf[1:] copy.
+    lut = _LUT
+    total: int = 0
+    current_value: int = lut[buf[0]]
+    codes = iter(buf)
+    next(codes)
+    for code in codes:
+        next_value: int = lut[code]
+    
+        if current_value < next_value:
+            total -= current_value
+        else:
+            total += current_value
+    
+        current_value = next_value
+    
+    total += current_value
+    return total
+
+
+def to_integer(s: str) -> int:
+    """
+    Convert an Alien Numeral string to its integer equivalent.
+    
+    Uses the step-by-step left-to-right method with peek-ahead logic:
+    1. Create a "bucket" (total) initialized to 0
+    2. Loop through the string from index 0 to second-to-last character
+    3. For each character, peek at the next character and compare values:
+       - If current_value < next_value: Subtract (subtraction case)
+       - If current_value >= next_value: Add (addition case)
+    4. After the loop, add the last character (always an addition case)
+    
+    Args:
+        s (str): The Alien Numeral string to convert. Must contain only
+            valid symbols: A, B, Z, L, C, D, R.
+    
+    Returns:
+        int: The integer value of the Alien Numeral string.
+    
+    Raises:
+        KeyError: If an invalid symbol is encountered in the string.
+    
+    Example:
+        >>> to_integer("RCRZCAB")
+        1994
+        >>> to_integer("AAA")
+        3
+    """
+    # Typical inputs are short enough to be served by a precomputed table
+    value = _SHORT_NUMERALS.get(s)
+    return value if value is not None else _to_integer_cached(s)
+
+
+def to_integers(numerals: Iterable[str]) -> List[int]:
+    """
+    Convert many Alien Numeral strings to integers in one batch.
+    
+    With NumPy installed, large batches are joined into a single buffer and
+    reduced in one vectorized pass (one np.add.reduceat segment per numeral),
+    so the per-call overhead of to_integer is paid once for the whole batch.
+    
+    Args:
+        numerals (Iterable[str]): The Alien Numeral strings to convert.
+    
+    Returns:
+        List[int]: The integer value of each numeral, in order.
+    
+    Raises:
+        KeyError: If an invalid symbol is encountered in any string.
+        ValueError: If any of the strings is empty.
+    
+    Example:
+        >>> to_integers(["AAA", "LBAAA", "RCRZCAB"])
+        [3, 58, 1994]
+    """
+    numerals = list(numerals)
+    if '' in numerals:
+        raise ValueError("Empty string is not a valid numeral")
+    
+    lengths = list(map(len, numerals))
+    if np is None or sum(lengths) < _BATCH_MIN_LENGTH:
+        return [to_integer(s) for s in numerals]
+    
+    values = _NP_LUT[
+        np.frombuffer(_encode_numeral(''.join(numerals)), dtype=np.uint8)
+    ]
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    
+    # Same branchless reduction as to_integer, except that the last symbol
+    # of every numeral is always added regardless of what follows it
+    subtract = np.zeros(len(values), dtype=bool)
+    subtract[:-1] = values[:-1] < values[1:]
+    subtract[ends - 1] = False
+    return np.add.reduceat(values - 2 * values * subtract, starts).tolist()
+
+
+def is_valid(s: str) -> bool:
+    """
+    Check if a string contains only valid Alien Numeral symbols.
+    
+    Args:
+        s (str): The string to validate.
+    
+    Returns:
+        bool: True if all characters are valid symbols, False otherwise.
+    
+    Example:
+        >>> is_valid("ABC")
+        True
+        >>> is_valid("XYZ")
+        False
+    """
+    return not s.translate(_DELETE_VALID)
+
+
+def is_valid_numeral(s: str) -> Tuple[bool, str]:
+    """
+    Check if a string follows proper Alien Numeral formation rules.
+    
+    Rules (similar to Roman numerals):
+    1. Only valid symbols allowed
+    2. Symbols cannot repeat more than their maximum allowed times
+       - A, Z, C, R can repeat up to 3 times (e.g., AAA = 3, but AAAA is invalid, use AB)
+       - B, L, D can appear only once (no BB, LL, DD)
+    3. Subtraction only works for specific pairs:
+       - A can only precede B or Z
+       - Z can only precede L or C
+       - C can only precede D or R
+    4. A smaller value can only appear before one larger value
+    
+    Args:
+        s (str): The Alien Numeral string to validate.
+    
+    Returns:
+        Tuple[bool, str]: (is_valid, error_message)
+            - (True, "") if valid
+            - (False, error_message) if invalid
+    
+    Example:
+        >>> is_valid_numeral("AAA")
+        (True, '')
+        >>> is_valid_numeral("AAAA")
+        (False, "Symbol 'A' repeats more than 3 times consecutively")
+        >>> is_valid_numeral("AB")
+        (True, '')
+    """
+    # Check if string is empty
+    if not s:
+        return (False, "Empty string is not a valid numeral")
+    
+    # Check if all characters are valid symbols
+    invalid_chars = s.translate(_DELETE_VALID)
+    if invalid_chars:
+        return (False, f"Invalid symbols: {', '.join(invalid_chars)}")
+    
+    # Bind the lookup tables to locals once instead of per character
+    lut = _LUT
+    max_repetitions = _MAX_REP
+    subtraction_pairs = AlienNumeralConverter.VALID_SUBTRACTION_PAIRS
+    pair_ok = _PAIR_OK
+    
+    # Check repetitions and subtraction pairs in a single pass over the
+    # ASCII codes. A repetition error anywhere takes precedence, so the
+    # first bad subtraction pair is only remembered until the scan ends.
+    codes = iter(s.encode('ascii'))
+    subtraction_error = ""
+    current_code = next(codes)
+    current_value = lut[current_code]
+    count = 1
+    for next_code in codes:
+        # Count consecutive repetitions against the maximum allowed
+        if next_code == current_code:
+            count += 1
+            max_allowed = max_repetitions[current_code]
+            if count > max_allowed:
+                return (False, f"Symbol '{chr(current_code)}' repeats more than {max_allowed} time(s) consecutively. Use subtraction notation instead (e.g., AB for 4, not AAAA)")
+            continue
         
-        return info
+        next_value = lut[next_code]
+        
+        # If current < next, it's a subtraction case - validate it with
+        # a single fetch from the pair table
+        if (current_value < next_value and not subtraction_error
+                and not pair_ok[(current_code << 7) | next_code]):
+            current, next_char = chr(current_code), chr(next_code)
+            if current not in subtraction_pairs:
+                subtraction_error = f"Symbol '{current}' cannot be used in subtraction notation"
+            else:
+                allowed = sorted(subtraction_pairs[current], key=AlienNumeralConverter.SYMBOL_VALUES.get)
+                subtraction_error = f"Invalid subtraction pair: '{current}{next_char}'. {current} can only precede {', '.join(allowed)}"
+        
+        current_code = next_code
+        current_value = next_value
+        count = 1
+    
+    if subtraction_error:
+        return (False, subtraction_error)
+    
+    return (True, "")
+
+
+def to_integer_safe(s: str) -> Tuple[Optional[int], str]:
+    """
+    Safely convert an Alien Numeral string to integer with validation.
+    
+    This function validates the numeral before conversion to ensure it follows
+    proper formation rules.
+    
+    Args:
+        s (str): The Alien Numeral string to convert.
+    
+    Returns:
+        Tuple[Optional[int], str]: (result, message)
+            - (integer_value, "") if successful
+            - (None, error_message) if validation fails
+    
+    Example:
+        >>> to_integer_safe("AAA")
+        (3, '')
+        >>> to_integer_safe("AAAA")
+        (None, "Symbol 'A' repeats more than 3 times consecutively...")
+    """
+    # A single symbol (the most common interactive input) is always valid
+    value = AlienNumeralConverter.SYMBOL_VALUES.get(s)
+    if value is not None:
+        return (value, "")
+    
+    valid, error_msg = is_valid_numeral(s)
+    
+    if not valid:
+        return (None, error_msg)
+    
+    try:
+        result = to_integer(s)
+        return (result, "")
+    except KeyError as e:
+        return (None, f"Invalid symbol encountered: {e}")
+
+
+# Every symbol string of up to four symbols (2800 entries) mapped to its
+# value, built once at import without going through the LRU cache
+_SHORT_NUMERALS: Dict[str, int] = {
+    numeral: _to_integer_cached.__wrapped__(numeral)
+    for numeral in map(''.join, chain.from_iterable(
+        product(AlienNumeralConverter.SYMBOL_VALUES, repeat=length)
+        for length in range(1, 5)
+    ))
+}
 
 
 def main() -> None:
     """
     Main function demonstrating the AlienNumeralConverter with test cases.
     """
-    # Create an instance of the converter
-    converter = AlienNumeralConverter()
+    # The converter's methods are static, so no instance is needed
+    converter = AlienNumeralConverter
     
     # Display symbol information
     print("=" * 60)
@@ -335,6 +649,26 @@ def main() -> None:
     print("-" * 60)
     print()
     
+    # Piped input: convert one numeral per line straight from the binary
+    # buffer instead of prompting with input() for every line
+    if not sys.stdin.isatty():
+        print("CONVERTING NUMERALS FROM STANDARD INPUT:")
+        print("-" * 60)
+        for raw_line in sys.stdin.buffer:
+            line = raw_line.strip().upper()
+            if not line:
+                continue
+            
+            numeral = line.decode(errors="replace")
+            result, error_msg = converter.to_integer_safe(numeral)
+            
+            if result is not None:
+                print(f"✓ {numeral:10} = {result}")
+            else:
+                print(f"✗ {numeral:10} | Invalid: {error_msg}")
+        print("-" * 60)
+        return
+    
     # Interactive section with validation
     print("Try your own conversions (press Ctrl+C to exit):")
     print("Note: The app validates proper numeral formation (e.g., AAAA is invalid, use AB)")